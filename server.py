@@ -5,20 +5,32 @@ Enables access to Google Drive documents (.gdoc, .gsheet, .gslides) via the Wind
 """
 
 import asyncio
+import atexit
+import contextlib
+import io
 import json
 import logging
 import os
+import queue
 import re
 import sys
+import threading
 import xml.etree.ElementTree as ET
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+from cachetools import LRUCache, TTLCache, cached
+from filelock import FileLock, Timeout
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -36,10 +48,21 @@ SCOPES = [
     'https://www.googleapis.com/auth/presentations.readonly',
 ]
 
+# Background token refresh: refresh this many seconds before the access token expires,
+# and wait this long before retrying a failed refresh
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_RETRY_DELAY = 60
+
+# Seconds to wait for another server instance to release the token file lock
+TOKEN_FILE_LOCK_TIMEOUT = 30
+
 # Configure logging
 # Log to both stderr (for CLI visibility) and a log file
-LOG_LEVEL = os.getenv('MCP_LOG_LEVEL', 'DEBUG').upper()
+LOG_LEVEL = os.getenv('MCP_LOG_LEVEL', 'INFO').upper()
 LOG_FILE = os.getenv('MCP_LOG_FILE', 'mcp_server.log')
+# The log file is rotated at this size, keeping this many old log files
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
 
 # Create logger
 logger = logging.getLogger('google_drive_mcp')
@@ -58,22 +81,149 @@ formatter = logging.Formatter(
 stderr_handler = logging.StreamHandler(sys.stderr)
 stderr_handler.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 stderr_handler.setFormatter(formatter)
-logger.addHandler(stderr_handler)
+log_handlers = [stderr_handler]
 
 # Handler for log file (always accessible)
+log_file_error = None
 try:
-    file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
+    file_handler = RotatingFileHandler(
+        LOG_FILE,
+        mode='a',
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        encoding='utf-8'
+    )
     file_handler.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    log_handlers.append(file_handler)
 except Exception as e:
+    log_file_error = e
+
+# The handlers above run on a background listener thread, so logging calls only
+# enqueue records and never block request handling on stderr or disk writes
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+if log_file_error is not None:
     # If we can't create the log file, at least log to stderr
-    logger.warning(f"Could not create log file {LOG_FILE}: {e}")
+    logger.warning(f"Could not create log file {LOG_FILE}: {log_file_error}")
 
 # Initialize the MCP server
 app = Server("google-drive-mcp-server")
 
 
+def _doc_content_fields(table_depth: int) -> str:
+    """Build the Docs API field mask for structural content with tables nested up to table_depth levels."""
+    paragraph_fields = "paragraph(elements(textRun(content)))"
+    if table_depth <= 0:
+        return f"content({paragraph_fields})"
+    return f"content({paragraph_fields},table(tableRows(tableCells({_doc_content_fields(table_depth - 1)}))))"
+
+
+# Drive export formats of Google Docs (export_google_document format -> MIME type)
+DOC_EXPORT_MIME_TYPES = {
+    'markdown': 'text/markdown',
+    'text': 'text/plain',
+}
+
+
+def _is_export_size_limit_error(error: HttpError) -> bool:
+    """Check whether a Drive export failed because the document is too large to export."""
+    return error.resp.status == 403 and b'exportSizeLimitExceeded' in (error.content or b'')
+
+
+# Field masks limiting API responses to the parts the readers use,
+# instead of the full documents with styling, revisions, named ranges, etc.
+DOC_FIELDS = f"title,body({_doc_content_fields(4)})"
+SPREADSHEET_FIELDS = "properties.title,sheets.properties(title,sheetType)"
+PRESENTATION_FIELDS = "title,slides(pageElements(shape(text(textElements(textRun(content))))))"
+
+# Folder metadata cache (folder_id -> (name, parent_id))
+# Folder names and parents rarely change during a session, the TTL bounds staleness
+FOLDER_CACHE_TTL = 300
+_folder_cache: TTLCache = TTLCache(maxsize=4096, ttl=FOLDER_CACHE_TTL)
+_folder_cache_lock = threading.Lock()
+
+# Folder searches give up after this many result pages (of up to 1000 folders each)
+FOLDER_SEARCH_MAX_PAGES = 3
+
+# Cached in place of a folder ID for folder paths matching no folder or several folders
+_UNRESOLVED_FOLDER = ''
+
+# Resolved documents are cached for at most this long, so renames and moves surface quickly
+PATH_CACHE_TTL = 600
+
+# Read document content cache ((document_id, modified_time, format) -> content)
+# Entries stay valid until the document changes, the least recently used ones are
+# evicted once the cached content exceeds CONTENT_CACHE_MAX_CHARS characters (~64 MB)
+CONTENT_CACHE_MAX_CHARS = 64 * 1024 * 1024
+_content_cache: LRUCache = LRUCache(maxsize=CONTENT_CACHE_MAX_CHARS, getsizeof=len)
+_content_cache_lock = threading.Lock()
+
+# Maximum number of calls in a single Google API batch request
+BATCH_SIZE_LIMIT = 100
+
+# API requests failing with rate limit (429) or server errors (5xx) are retried this often,
+# with exponential backoff; requests time out after HTTP_TIMEOUT seconds without a response
+API_NUM_RETRIES = 3
+HTTP_TIMEOUT = 60
+
+# Size in bytes of the chunks Drive exports are downloaded in
+EXPORT_CHUNK_SIZE = 1 << 20
+
+# Path separators (with surrounding whitespace) and folder paths meaning "no folder"
+_PATH_SPLIT = re.compile(r'\s*[\\/]+\s*')
+_ROOT_MARKERS = frozenset({'.', './', '', '/'})
+
+# MIME type of Google Drive folders
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# MIME types of Google Docs, Sheets and Slides
+DOCUMENT_MIME_TYPE = 'application/vnd.google-apps.document'
+SPREADSHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+PRESENTATION_MIME_TYPE = 'application/vnd.google-apps.presentation'
+
+# Google Drive MIME types of the document file extensions
+_EXT_TO_MIME = {
+    '.gdoc': DOCUMENT_MIME_TYPE,
+    '.gsheet': SPREADSHEET_MIME_TYPE,
+    '.gslides': PRESENTATION_MIME_TYPE,
+}
+
+
+@cached(cache=_folder_cache, key=lambda service, folder_id: folder_id, lock=_folder_cache_lock)
+def _fetch_folder_meta(service, folder_id: str) -> Tuple[str, Optional[str]]:
+    """
+    Fetch the name and parent ID of a Google Drive folder.
+    
+    Results are memoized in the module-level folder cache, so walking the parent
+    chain of many files only costs one request per folder not seen recently.
+    
+    Args:
+        service: Google Drive v3 service
+        folder_id: ID of the folder
+    
+    Returns:
+        (folder_name, parent_id) where parent_id is None for root folders
+    """
+    folder_info = service.files().get(
+        fileId=folder_id,
+        fields="id, name, parents"
+    ).execute()
+    parents = folder_info.get('parents', [])
+    return folder_info.get('name', ''), (parents[0] if parents else None)
+
+
+class RetryingHttpRequest(HttpRequest):
+    """HttpRequest that retries rate-limited and failed requests by default."""
+    
+    def execute(self, http=None, num_retries=API_NUM_RETRIES):
+        return super().execute(http=http, num_retries=num_retries)
+
+
 class GoogleDriveClient:
     """Client for interacting with Google Drive API."""
     
@@ -138,12 +288,26 @@ class GoogleDriveClient:
                     raise ValueError(error_msg)
         
         logger.info("Authenticating with Google using OAuth2...")
+        self.token_path = os.getenv('GOOGLE_TOKEN_PATH', 'token.json')
+        self._token_lock = threading.Lock()
+        # Serializes token refreshes across server instances sharing the token file
+        self._token_file_lock = FileLock(f"{self.token_path}.lock")
         self.creds = self._authenticate(creds_data)
         logger.info("Building Google API services...")
-        self.drive_service = build('drive', 'v3', credentials=self.creds)
-        self.docs_service = build('docs', 'v1', credentials=self.creds)
-        self.sheets_service = build('sheets', 'v4', credentials=self.creds)
-        self.slides_service = build('slides', 'v1', credentials=self.creds)
+        # All services share one authorized HTTP transport per thread, so successive requests
+        # reuse the open TLS connections to *.googleapis.com instead of reconnecting
+        self._http_local = threading.local()
+        self.drive_service = self._build_service('drive', 'v3')
+        self.docs_service = self._build_service('docs', 'v1')
+        self.sheets_service = self._build_service('sheets', 'v4')
+        self.slides_service = self._build_service('slides', 'v1')
+        
+        # Resolved folder paths for this session (folder path -> folder ID, or _UNRESOLVED_FOLDER)
+        self._folder_id_cache: TTLCache = TTLCache(maxsize=1024, ttl=FOLDER_CACHE_TTL)
+        # Resolved documents (folder path, document name, MIME type) -> document ID
+        self._path_cache: TTLCache = TTLCache(maxsize=1024, ttl=PATH_CACHE_TTL)
+        # Lookups run in worker threads, so the caches above are guarded by a lock
+        self._cache_lock = threading.Lock()
         logger.info("Google Drive client initialized successfully")
     
     def _authenticate(self, creds_data: Dict[str, Any]) -> Credentials:
@@ -156,66 +320,179 @@ class GoogleDriveClient:
         Returns:
             Valid OAuth2 credentials
         """
-        creds = None
-        
-        # Try to load existing token
-        token_path = os.getenv('GOOGLE_TOKEN_PATH', 'token.json')
-        if os.path.exists(token_path):
-            logger.info(f"Loading existing token from {token_path}")
-            try:
-                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-            except Exception as e:
-                logger.warning(f"Failed to load existing token: {e}, will re-authenticate")
-                creds = None
-        
-        # If no valid credentials, run OAuth flow
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+        # Hold the token file lock, so concurrent server instances don't refresh the
+        # same token at the same time and invalidate each other's access tokens
+        with self._token_file_locked():
+            # Try to load existing token
+            creds = self._load_token()
+            if self._token_is_fresh(creds):
+                logger.info("Using existing valid token")
+                return creds
+            
+            # The token is missing or about to expire, try refreshing it
+            if creds and creds.refresh_token:
                 logger.info("Token expired, refreshing...")
                 try:
                     creds.refresh(Request())
                     logger.info("Token refreshed successfully")
+                    self._save_token(creds)
+                    return creds
                 except Exception as e:
                     logger.warning(f"Failed to refresh token: {e}, will re-authenticate")
-                    creds = None
-            
-            if not creds or not creds.valid:
-                # Run OAuth2 flow
-                if 'installed' in creds_data or 'web' in creds_data:
-                    logger.info("Starting OAuth2 flow (browser will open)...")
-                    logger.info("Please complete the authentication in your browser.")
-                    flow = InstalledAppFlow.from_client_config(creds_data, SCOPES)
-                    creds = flow.run_local_server(port=0)
-                    logger.info("OAuth2 authentication completed successfully")
-                else:
-                    error_msg = (
-                        "Invalid OAuth2 credentials format. "
-                        "Credentials must contain 'installed' or 'web' key with client_id and client_secret."
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-            
-            # Save token for future use
-            if token_path and creds:
-                try:
-                    logger.info(f"Saving token to {token_path}")
-                    with open(token_path, 'w') as token:
-                        token.write(creds.to_json())
-                except Exception as e:
-                    logger.warning(f"Failed to save token: {e}")
+        
+        # Run OAuth2 flow. It waits for the user in the browser, so it runs without the
+        # token file lock, which would block other server instances meanwhile.
+        if 'installed' in creds_data or 'web' in creds_data:
+            logger.info("Starting OAuth2 flow (browser will open)...")
+            logger.info("Please complete the authentication in your browser.")
+            flow = InstalledAppFlow.from_client_config(creds_data, SCOPES)
+            creds = flow.run_local_server(port=0)
+            logger.info("OAuth2 authentication completed successfully")
         else:
-            logger.info("Using existing valid token")
+            error_msg = (
+                "Invalid OAuth2 credentials format. "
+                "Credentials must contain 'installed' or 'web' key with client_id and client_secret."
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Save token for future use
+        with self._token_file_locked():
+            self._save_token(creds)
         
         return creds
     
+    @contextlib.contextmanager
+    def _token_file_locked(self):
+        """
+        Hold the token file lock while the block runs.
+        
+        If the lock can't be taken, e.g. because the token directory isn't writable or another
+        server instance holds it for more than TOKEN_FILE_LOCK_TIMEOUT seconds, the block runs
+        without it; at worst, concurrent instances then refresh the token twice.
+        """
+        try:
+            self._token_file_lock.acquire(timeout=TOKEN_FILE_LOCK_TIMEOUT)
+            locked = True
+        except (Timeout, OSError) as e:
+            logger.warning(f"Could not lock token file {self.token_path}: {e}, continuing without the lock")
+            locked = False
+        try:
+            yield
+        finally:
+            if locked:
+                self._token_file_lock.release()
+    
+    def _load_token(self) -> Optional[Credentials]:
+        """Load the saved OAuth2 token from the token file, if there is one."""
+        if not os.path.exists(self.token_path):
+            return None
+        
+        logger.info(f"Loading existing token from {self.token_path}")
+        try:
+            return Credentials.from_authorized_user_file(self.token_path, SCOPES)
+        except Exception as e:
+            logger.warning(f"Failed to load existing token: {e}, will re-authenticate")
+            return None
+    
+    @staticmethod
+    def _token_is_fresh(creds: Optional[Credentials]) -> bool:
+        """Check whether the access token stays valid for at least TOKEN_REFRESH_MARGIN seconds."""
+        if not creds or not creds.valid:
+            return False
+        if creds.expiry is None:
+            return True
+        return (creds.expiry - datetime.utcnow()).total_seconds() > TOKEN_REFRESH_MARGIN
+    
+    def _save_token(self, creds: Credentials) -> None:
+        """Save the OAuth2 token to the token file for future use."""
+        if self.token_path and creds:
+            try:
+                logger.info(f"Saving token to {self.token_path}")
+                with open(self.token_path, 'w') as token:
+                    token.write(creds.to_json())
+            except Exception as e:
+                logger.warning(f"Failed to save token: {e}")
+    
+    def _refresh_token(self) -> None:
+        """Refresh the access token and save it for future use."""
+        with self._token_lock, self._token_file_locked():
+            # Another server instance may have refreshed the token already
+            stored_creds = self._load_token()
+            if self._token_is_fresh(stored_creds) and stored_creds.refresh_token == self.creds.refresh_token:
+                logger.info("Using token refreshed by another process")
+                self.creds.token = stored_creds.token
+                self.creds.expiry = stored_creds.expiry
+                return
+            
+            logger.info("Refreshing access token...")
+            self.creds.refresh(Request())
+            logger.info("Token refreshed successfully")
+            self._save_token(self.creds)
+    
+    async def token_refresh_loop(self) -> None:
+        """
+        Keep the access token fresh in the background.
+        
+        Refreshes the token TOKEN_REFRESH_MARGIN seconds before it expires, so tool calls
+        never pay for a token refresh round trip on their critical path.
+        """
+        while self.creds.refresh_token and self.creds.expiry:
+            remaining = (self.creds.expiry - datetime.utcnow()).total_seconds()
+            if remaining > TOKEN_REFRESH_MARGIN:
+                await asyncio.sleep(remaining - TOKEN_REFRESH_MARGIN)
+                # The token may have been refreshed on demand in the meantime
+                continue
+            
+            try:
+                await asyncio.to_thread(self._refresh_token)
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}, retrying in {TOKEN_REFRESH_RETRY_DELAY}s")
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_DELAY)
+    
+    def warm_up(self) -> None:
+        """
+        Make a cheap Drive request, so the connection to Google is open before the first tool call.
+        """
+        about = self.drive_service.about().get(fields="user(emailAddress)").execute()
+        logger.info(f"Connected to Google Drive as {about.get('user', {}).get('emailAddress', 'unknown user')}")
+    
+    def _build_service(self, service_name: str, version: str):
+        """
+        Build a Google API service on the shared transport.
+        
+        Uses the discovery documents bundled with google-api-python-client instead of
+        downloading them, so building the services makes no network requests at startup.
+        """
+        return build(
+            service_name,
+            version,
+            http=self._authorized_http(),
+            requestBuilder=self._build_request,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+    
+    def _authorized_http(self) -> AuthorizedHttp:
+        """
+        Get the authorized HTTP transport of the current thread.
+        
+        httplib2.Http is not thread-safe, so each thread gets its own transport,
+        created on first use and reused for all later requests of that thread.
+        """
+        http = getattr(self._http_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._http_local.http = http
+        return http
+    
+    def _build_request(self, http, *args, **kwargs) -> HttpRequest:
+        """Build an API request that runs on the calling thread's shared transport."""
+        return RetryingHttpRequest(self._authorized_http(), *args, **kwargs)
+    
     def _get_mime_type_from_extension(self, extension: str) -> str:
         """Get Google Drive MIME type from file extension."""
-        mime_types = {
-            '.gdoc': 'application/vnd.google-apps.document',
-            '.gsheet': 'application/vnd.google-apps.spreadsheet',
-            '.gslides': 'application/vnd.google-apps.presentation',
-        }
-        return mime_types.get(extension.lower(), '')
+        return _EXT_TO_MIME.get(extension.lower(), '')
     
     def _parse_file_path(self, file_path: str) -> Tuple[str, str, str]:
         """
@@ -237,7 +514,7 @@ class GoogleDriveClient:
         folder_path_normalized = folder_path.replace('\\', '/')
         
         # Handle relative paths (e.g., just "Document.gdoc" or "./Document.gdoc")
-        if folder_path_normalized in ['.', './', '']:
+        if folder_path_normalized in _ROOT_MARKERS:
             return document_name, '', extension
         
         # Remove drive letter (e.g., "u:/My Drive/Projects" -> "My Drive/Projects")
@@ -246,14 +523,8 @@ class GoogleDriveClient:
             if len(parts) > 1:
                 folder_path_normalized = parts[1]
         
-        # Remove leading/trailing slashes
-        folder_path_normalized = folder_path_normalized.strip('/')
-        
-        if not folder_path_normalized:
-            return document_name, '', extension
-        
-        # Split into parts
-        path_parts = [p.strip() for p in folder_path_normalized.split('/') if p.strip()]
+        # Split into parts, dropping empty parts and surrounding whitespace
+        path_parts = [p for p in _PATH_SPLIT.split(folder_path_normalized.strip()) if p]
         
         if not path_parts:
             return document_name, '', extension
@@ -261,50 +532,30 @@ class GoogleDriveClient:
         # The remaining parts are the actual folder path in Google Drive
         actual_folder_path = '/'.join(path_parts)
         
-        logger.debug(f"Parsed path - Document: '{document_name}', Folder: '{actual_folder_path}'")
+        logger.debug("Parsed path - Document: '%s', Folder: '%s'", document_name, actual_folder_path)
         
         return document_name, actual_folder_path, extension
     
-    def _get_file_path(self, file_id: str) -> str:
+    def _get_folder_path(self, folder_id: str) -> str:
         """
-        Get the full folder path of a file by traversing its parent chain.
+        Get the full path of a folder (including the folder itself) by traversing its parent chain.
         
         Args:
-            file_id: ID of the file
+            folder_id: ID of the folder
         
         Returns:
             Full folder path as a string like "Projects/Aideia/code" (actual folder names only)
         """
         path_parts = []
-        current_id = file_id
+        current_id = folder_id
         
         try:
-            # First, get the file to find its parent folder
-            file_info = self.drive_service.files().get(
-                fileId=file_id,
-                fields="id, name, parents"
-            ).execute()
-            
-            parents = file_info.get('parents', [])
-            if not parents:
-                # File is in root
-                return ''
-            
-            # Start from the file's parent folder
-            current_id = parents[0]  # Usually one parent
-            
             # Traverse up the parent chain to root
             while current_id and current_id != 'root':
-                folder_info = self.drive_service.files().get(
-                    fileId=current_id,
-                    fields="id, name, parents"
-                ).execute()
+                folder_name, parent_id = _fetch_folder_meta(self.drive_service, current_id)
                 
-                folder_name = folder_info.get('name', '')
-                parents = folder_info.get('parents', [])
-                
-                # If no parents or parent is 'root', we've reached a root
-                if not parents or (parents and parents[0] == 'root'):
+                # If no parent or parent is 'root', we've reached a root
+                if not parent_id or parent_id == 'root':
                     # Add the root folder name if it exists
                     if folder_name:
                         path_parts.insert(0, folder_name)
@@ -314,16 +565,95 @@ class GoogleDriveClient:
                 if folder_name:
                     path_parts.insert(0, folder_name)
                 
-                current_id = parents[0]  # Move to parent
+                current_id = parent_id  # Move to parent
             
             final_path = '/'.join(path_parts)
-            logger.debug(f"Final constructed path: '{final_path}'")
+            logger.debug("Final constructed path: '%s'", final_path)
             return final_path
             
         except HttpError as e:
-            logger.debug(f"Error getting path for file {file_id}: {e}")
+            logger.debug("Error getting path for folder %s: %s", folder_id, e)
             return ''
     
+    def _prefetch_folder_chains(self, folder_ids: List[str]) -> None:
+        """
+        Load the parent chains of several folders into the folder cache.
+        
+        Instead of walking each chain with one request per folder, all chains are walked
+        together level by level: the unknown folders of a level are fetched with a single
+        batch request. k chains of depth d cost d batch requests instead of k × d requests.
+        Folders that fail to load are left out, so _get_folder_path reports the error.
+        
+        Args:
+            folder_ids: IDs of the folders whose chains should be cached
+        """
+        pending = set(folder_ids)
+        
+        while pending:
+            # Follow each chain through the cache up to its first unknown folder
+            to_fetch = set()
+            for folder_id in pending:
+                uncached_id = self._first_uncached_folder(folder_id)
+                if uncached_id:
+                    to_fetch.add(uncached_id)
+            
+            if not to_fetch:
+                return
+            
+            logger.debug("Fetching %d folder(s) in a batch request", len(to_fetch))
+            pending = self._batch_fetch_folder_meta(sorted(to_fetch))
+    
+    def _first_uncached_folder(self, folder_id: str) -> Optional[str]:
+        """
+        Follow a folder's parent chain through the folder cache.
+        
+        Args:
+            folder_id: ID of the folder
+        
+        Returns:
+            ID of the first folder in the chain missing from the cache, None if the whole chain is cached
+        """
+        current_id = folder_id
+        while current_id and current_id != 'root':
+            with _folder_cache_lock:
+                meta = _folder_cache.get(current_id)
+            if meta is None:
+                return current_id
+            current_id = meta[1]
+        return None
+    
+    def _batch_fetch_folder_meta(self, folder_ids: List[str]) -> set:
+        """
+        Fetch the metadata of several folders with batch requests and store it in the folder cache.
+        
+        Args:
+            folder_ids: IDs of the folders to fetch
+        
+        Returns:
+            Set of the folder IDs that were fetched successfully
+        """
+        fetched = set()
+        
+        def store_folder_meta(request_id, response, exception):
+            if exception is not None:
+                logger.debug("Error fetching folder %s: %s", request_id, exception)
+                return
+            parents = response.get('parents', [])
+            with _folder_cache_lock:
+                _folder_cache[request_id] = (response.get('name', ''), (parents[0] if parents else None))
+            fetched.add(request_id)
+        
+        for i in range(0, len(folder_ids), BATCH_SIZE_LIMIT):
+            batch = self.drive_service.new_batch_http_request(callback=store_folder_meta)
+            for folder_id in folder_ids[i:i + BATCH_SIZE_LIMIT]:
+                batch.add(
+                    self.drive_service.files().get(fileId=folder_id, fields="id, name, parents"),
+                    request_id=folder_id
+                )
+            batch.execute()
+        
+        return fetched
+    
     def _normalize_path(self, path: str) -> str:
         """
         Normalize a path for comparison (remove empty parts, trim).
@@ -334,12 +664,23 @@ class GoogleDriveClient:
         Returns:
             Normalized path
         """
+        return '/'.join(self._split_path(path))
+    
+    def _split_path(self, path: str) -> List[str]:
+        """
+        Split a path into its folder names (remove empty parts, trim).
+        
+        Args:
+            path: Path string like "Projects/Aideia/code"
+        
+        Returns:
+            Folder names like ["Projects", "Aideia", "code"]
+        """
         if not path:
-            return ''
-        parts = [p.strip() for p in path.split('/') if p.strip()]
-        return '/'.join(parts)
+            return []
+        return [p for p in _PATH_SPLIT.split(path.strip()) if p]
     
-    def _paths_match_backwards(self, expected_path: str, actual_path: str) -> bool:
+    def _paths_match_backwards(self, expected_parts: List[str], actual_parts: List[str]) -> bool:
         """
         Verify paths by matching backwards from the end.
         
@@ -354,66 +695,156 @@ class GoogleDriveClient:
             Result: Match (extra "My Drive" in actual path is ignored)
         
         Args:
-            expected_path: Path from filesystem like "Projects/Aideia" (after removing drive letter)
-            actual_path: Full path from Google Drive like "My Drive/Projects/Aideia"
+            expected_parts: Split path from filesystem like ["Projects", "Aideia"] (after removing drive letter)
+            actual_parts: Split full path from Google Drive like ["My Drive", "Projects", "Aideia"]
         
         Returns:
             True if all expected path parts match backwards in actual path
         """
-        # Normalize paths
-        expected_parts = [p.strip() for p in expected_path.split('/') if p.strip()] if expected_path else []
-        actual_parts = [p.strip() for p in actual_path.split('/') if p.strip()] if actual_path else []
-        
         # If expected path is empty, document should be in root
         if not expected_parts:
             # Empty expected path means root - any actual path is acceptable
             return True
         
-        # If actual path is empty but expected is not, no match
-        if not actual_parts:
-            return False
+        # The actual path must end with all expected folder names, in order
+        matched = len(actual_parts) >= len(expected_parts) and actual_parts[-len(expected_parts):] == expected_parts
         
-        # Match backwards from the end
-        expected_idx = len(expected_parts) - 1  # Start from last expected part
-        actual_idx = len(actual_parts) - 1       # Start from last actual part
+        logger.debug("Matching backwards - Expected: %s, Actual: %s: %s",
+                     expected_parts, actual_parts, '✓ match' if matched else '✗ mismatch')
         
-        logger.debug(f"Matching backwards - Expected: {expected_parts}, Actual: {actual_parts}")
+        return matched
+    
+    def forget_document_path(self, file_path: str) -> None:
+        """
+        Drop the cached document ID of a filesystem path.
         
-        # Match folder names from end to beginning
-        # Continue until all expected parts are matched
-        while expected_idx >= 0:
-            # If we've run out of actual parts, no match
-            if actual_idx < 0:
-                logger.debug(f"  ✗ Ran out of actual parts, {expected_idx + 1} expected parts remain")
-                return False
-            
-            expected_part = expected_parts[expected_idx]
-            actual_part = actual_parts[actual_idx]
-            
-            logger.debug(f"  Comparing: expected[{expected_idx}]='{expected_part}' vs actual[{actual_idx}]='{actual_part}'")
-            
-            # Compare folder names
-            if expected_part == actual_part:
-                logger.debug(f"  ✓ Match: '{expected_part}'")
-                expected_idx -= 1
-                actual_idx -= 1
-            else:
-                logger.debug(f"  ✗ Mismatch: '{expected_part}' != '{actual_part}'")
-                return False
+        Used when the cached ID turned out to be stale, e.g. because the document was moved or deleted.
+        
+        Args:
+            file_path: Filesystem path like "G:\\My Drive\\Projects\\Document.gdoc"
+        """
+        document_name, expected_folder_path, extension = self._parse_file_path(file_path)
+        cache_key = (
+            self._normalize_path(expected_folder_path),
+            document_name,
+            self._get_mime_type_from_extension(extension),
+        )
+        with self._cache_lock:
+            if self._path_cache.pop(cache_key, None):
+                logger.info(f"Dropped cached document ID for {file_path}")
+    
+    def _resolve_folder_id(self, folder_path: str) -> Optional[str]:
+        """
+        Resolve a folder path to the ID of its last folder.
+        
+        Searches for folders named like any path segment and keeps the ones named like the
+        last segment whose parent chain matches the path backwards. Resolved paths are cached for the session.
+        
+        Args:
+            folder_path: Normalized folder path like "My Drive/Projects/Aideia"
+        
+        Returns:
+            Folder ID if exactly one folder matches the path, None if none or several do,
+            or the folders can't be listed
+        """
+        if not folder_path:
+            return None
+        
+        with self._cache_lock:
+            folder_id = self._folder_id_cache.get(folder_path)
+        if folder_id is not None:
+            logger.debug("Folder '%s' resolved from cache: %s", folder_path, folder_id or 'no single folder')
+            return folder_id or None
+        
+        # The folder only narrows the document search, so failing to resolve it
+        # must not fail the lookup; the caller searches without it instead
+        try:
+            folder_id = self._find_folder_id(folder_path)
+        except HttpError as e:
+            logger.warning(f"Could not resolve folder '{folder_path}': {e}")
+            return None
         
-        # All expected parts matched
-        logger.debug(f"  ✓ All {len(expected_parts)} expected parts matched successfully")
-        return True
+        # Paths matching no folder or several folders are cached too, so e.g. documents at the
+        # top of My Drive (whose root folder is never listed) don't repeat the folder search
+        with self._cache_lock:
+            self._folder_id_cache[folder_path] = folder_id or _UNRESOLVED_FOLDER
+        return folder_id
+    
+    def _find_folder_id(self, folder_path: str) -> Optional[str]:
+        """Find the ID of the only folder at folder_path in Google Drive, see _resolve_folder_id."""
+        expected_parts = self._split_path(folder_path)
+        folder_name = expected_parts[-1]
+        
+        # The first segment is the root label (e.g. "My Drive"), whose folder never shows up
+        # in folder listings, so a path of just the root can't be narrowed to a folder
+        if len(expected_parts) < 2:
+            return None
+        
+        # List the folders named like any other path segment with a single query. Besides
+        # the candidates for the last segment, this loads most of their parent chains up front.
+        # Drive queries have no "name in (...)" operator, so the names are OR'ed.
+        name_terms = " or ".join(
+            "name='{}'".format(name.replace("'", "\\'")) for name in dict.fromkeys(expected_parts[1:])
+        )
+        query = f"({name_terms}) and mimeType='{FOLDER_MIME_TYPE}' and trashed=false"
+        logger.debug("Folder search query: %s", query)
+        
+        listed_folders: List[Dict[str, Any]] = []
+        page_token = None
+        for _ in range(FOLDER_SEARCH_MAX_PAGES):
+            results = self.drive_service.files().list(
+                q=query,
+                fields="nextPageToken, files(id, name, parents)",
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+            listed_folders.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+        else:
+            # Common folder names can match a large part of the Drive; searching the
+            # document by name only is cheaper than listing all of them
+            logger.debug("Too many folders named like the segments of '%s', not using a folder constraint", folder_path)
+            return None
+        
+        # Folders named like the other segments only serve as parent chain metadata
+        folders = [folder for folder in listed_folders if folder.get('name') == folder_name]
+        if not folders:
+            logger.debug("No folders found matching name '%s'", folder_name)
+            return None
+        
+        # The listings already carry each folder's name and parent, so only the
+        # ancestors not named like a path segment still need fetching
+        with _folder_cache_lock:
+            for folder in listed_folders:
+                parents = folder.get('parents', [])
+                _folder_cache[folder['id']] = (folder.get('name', ''), (parents[0] if parents else None))
+        self._prefetch_folder_chains([folder['id'] for folder in folders])
+        
+        matches = [
+            folder['id'] for folder in folders
+            if self._paths_match_backwards(expected_parts, self._split_path(self._get_folder_path(folder['id'])))
+        ]
+        
+        if len(matches) != 1:
+            logger.debug("Folder path '%s' matched %d folder(s), not using a folder constraint", folder_path, len(matches))
+            return None
+        
+        logger.debug("Resolved folder '%s' to ID: %s", folder_path, matches[0])
+        return matches[0]
     
     def find_document_by_path(self, file_path: str) -> Optional[str]:
         """
         Find a Google Drive document by its filesystem path.
         
         Strategy:
-        1. Search for all documents with the matching name and MIME type
-        2. For each match, fetch its full folder path by traversing parents
-        3. Compare the fetched path with the expected path from filesystem
-        4. Return the document whose path matches
+        1. Resolve the expected folder path to a folder ID; if it resolves, search for the
+           document with the matching name and MIME type inside that folder only
+        2. Otherwise, search for all documents with the matching name and MIME type
+        3. For each match, fetch its full folder path by traversing parents
+        4. Compare the fetched path with the expected path from filesystem
+        5. Return the document whose path matches
         
         Args:
             file_path: Filesystem path like "G:\\My Drive\\Projects\\Document.gdoc"
@@ -428,7 +859,7 @@ class GoogleDriveClient:
             document_name, expected_folder_path, extension = self._parse_file_path(file_path)
             mime_type = self._get_mime_type_from_extension(extension)
             
-            logger.debug(f"Parsed path - Name: '{document_name}', Expected folder: '{expected_folder_path}', Type: {mime_type}")
+            logger.debug("Parsed path - Name: '%s', Expected folder: '%s', Type: %s", document_name, expected_folder_path, mime_type)
             
             if not mime_type:
                 logger.error(f"Unknown file extension: {extension}")
@@ -436,13 +867,27 @@ class GoogleDriveClient:
             
             # Normalize expected path for comparison
             expected_path_normalized = self._normalize_path(expected_folder_path)
+            
+            cache_key = (expected_path_normalized, document_name, mime_type)
+            with self._cache_lock:
+                file_id = self._path_cache.get(cache_key)
+            if file_id:
+                logger.info(f"Found document '{document_name}' in cache (ID: {file_id})")
+                return file_id
+            
             logger.info(f"Searching for document '{document_name}' (type: {mime_type}), expected in folder: '{expected_path_normalized}'")
             
-            # Search for all documents with this name and type (no folder constraint)
             escaped_name = document_name.replace("'", "\\'")
-            query = f"name='{escaped_name}' and mimeType='{mime_type}' and trashed=false"
+            folder_id = self._resolve_folder_id(expected_path_normalized)
             
-            logger.debug(f"Document search query: {query}")
+            if folder_id:
+                # The folder is known, so only documents directly inside it can match
+                query = f"name='{escaped_name}' and mimeType='{mime_type}' and '{folder_id}' in parents and trashed=false"
+            else:
+                # Search for all documents with this name and type (no folder constraint)
+                query = f"name='{escaped_name}' and mimeType='{mime_type}' and trashed=false"
+            
+            logger.debug("Document search query: %s", query)
             
             results = self.drive_service.files().list(
                 q=query,
@@ -456,23 +901,45 @@ class GoogleDriveClient:
                 logger.warning(f"No documents found matching name '{document_name}' (type: {mime_type})")
                 return None
             
+            if folder_id:
+                file_id = files[0]['id']
+                logger.info(f"✓ Found document '{files[0].get('name', '')}' (ID: {file_id}) in folder '{expected_path_normalized}'")
+                with self._cache_lock:
+                    self._path_cache[cache_key] = file_id
+                return file_id
+            
             logger.info(f"Found {len(files)} document(s) with name '{document_name}', checking paths...")
             
+            # Split the expected path once for all candidates
+            expected_parts = self._split_path(expected_path_normalized)
+            
+            # Check candidates with fully cached parent chains first: they need no requests,
+            # and a match among them saves walking the other candidates' chains
+            files.sort(key=lambda file: bool(file.get('parents')) and self._first_uncached_folder(file['parents'][0]) is not None)
+            chains_loaded = False
+            
             # Check each document's path
             for i, file in enumerate(files, 1):
                 file_id = file['id']
                 file_name = file.get('name', '')
-                logger.debug(f"Checking document {i}/{len(files)}: '{file_name}' (ID: {file_id})")
+                logger.debug("Checking document %d/%d: '%s' (ID: %s)", i, len(files), file_name, file_id)
+                
+                parents = file.get('parents', [])
+                if parents and not chains_loaded and self._first_uncached_folder(parents[0]):
+                    # Load the remaining candidates' parent chains, one batch request per folder level
+                    self._prefetch_folder_chains([f['parents'][0] for f in files[i - 1:] if f.get('parents')])
+                    chains_loaded = True
                 
-                # Get the actual folder path of this document
-                actual_folder_path = self._get_file_path(file_id)
-                actual_path_normalized = self._normalize_path(actual_folder_path)
+                # Get the actual folder path of this document (served from the folder cache)
+                actual_folder_path = self._get_folder_path(parents[0]) if parents else ''
+                actual_parts = self._split_path(actual_folder_path)
+                actual_path_normalized = '/'.join(actual_parts)
                 
-                logger.debug(f"  Document '{file_name}' is in folder: '{actual_path_normalized}'")
-                logger.debug(f"  Expected folder path: '{expected_path_normalized}'")
+                logger.debug("  Document '%s' is in folder: '%s'", file_name, actual_path_normalized)
+                logger.debug("  Expected folder path: '%s'", expected_path_normalized)
                 
                 # Compare paths using backwards matching
-                if self._paths_match_backwards(expected_path_normalized, actual_path_normalized):
+                if self._paths_match_backwards(expected_parts, actual_parts):
                     logger.info(f"✓ Path match! Found document '{file_name}' (ID: {file_id}) in folder '{actual_path_normalized}'")
                     
                     # Verify the document by fetching it directly
@@ -486,15 +953,19 @@ class GoogleDriveClient:
                         verified_mime = file_info.get('mimeType', '')
                         
                         logger.info(f"Verified document '{verified_name}' with ID: {file_id} (MIME: {verified_mime})")
+                        with self._cache_lock:
+                            self._path_cache[cache_key] = file_id
                         return file_id
                         
                     except HttpError as e:
                         logger.error(f"Failed to verify document {file_id}: {e}")
                         # Still return the ID if path matched
                         logger.warning(f"Returning document ID despite verification failure (path matched)")
+                        with self._cache_lock:
+                            self._path_cache[cache_key] = file_id
                         return file_id
                 else:
-                    logger.debug(f"  ✗ Path mismatch: expected path '{expected_path_normalized}' not found in actual path '{actual_path_normalized}'")
+                    logger.debug("  ✗ Path mismatch: expected path '%s' not found in actual path '%s'", expected_path_normalized, actual_path_normalized)
             
             logger.warning(f"None of the {len(files)} documents matched the expected path: '{expected_path_normalized}'")
             return None
@@ -506,118 +977,336 @@ class GoogleDriveClient:
             logger.error(f"Error finding document by path: {e}", exc_info=True)
             return None
     
-    def read_google_doc(self, document_id: str) -> str:
-        """Read content from a Google Doc and convert to markdown-like text."""
+    def _export_document(self, document_id: str, mime_type: str) -> str:
+        """
+        Export a Google Workspace document through the Drive API.
+        
+        The conversion happens server-side, so only the converted text is downloaded.
+        Large exports are downloaded in chunks straight into a byte buffer.
+        
+        Args:
+            document_id: The Google Drive document ID
+            mime_type: Export MIME type, like 'text/markdown' or 'text/plain'
+        
+        Returns:
+            Exported document content
+        """
+        request = self.drive_service.files().export_media(
+            fileId=document_id,
+            mimeType=mime_type
+        )
+        buf = io.BytesIO()
+        downloader = MediaIoBaseDownload(buf, request, chunksize=EXPORT_CHUNK_SIZE)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk(num_retries=API_NUM_RETRIES)
+        return buf.getvalue().decode('utf-8')
+    
+    def _read_cached(self, document_id: str, content_format: str, read: Callable[[], Tuple[str, bool]]) -> str:
+        """
+        Return the cached content of a document, or read and cache it.
+        
+        Cached content is keyed on the document's modification time, so a cheap metadata
+        request decides whether the document changed since it was read.
+        
+        Args:
+            document_id: The Google Drive document ID
+            content_format: Format of the content, part of the cache key
+            read: Function reading the document on a cache miss, returning its content and
+                  whether the content is complete; partial content (e.g. with parts that
+                  failed to load) is returned but not cached
+        
+        Returns:
+            Document content
+        """
+        try:
+            file_info = self.drive_service.files().get(
+                fileId=document_id,
+                fields="modifiedTime"
+            ).execute()
+        except HttpError as e:
+            # The document is gone or no longer accessible, so its cached content is stale
+            if e.resp.status in (403, 404):
+                with _content_cache_lock:
+                    for key in [key for key in _content_cache if key[0] == document_id]:
+                        del _content_cache[key]
+            logger.debug(f"Could not get modification time of {document_id}: {e}")
+            file_info = None
+        
+        if file_info is None:
+            # Reading the document reports the error, if it persists
+            return read()[0]
+        
+        cache_key = (document_id, file_info.get('modifiedTime', ''), content_format)
+        with _content_cache_lock:
+            content = _content_cache.get(cache_key)
+        if content is not None:
+            logger.info(f"Found content of {document_id} ({content_format}) in cache")
+            return content
+        
+        content, complete = read()
+        if not complete:
+            logger.info(f"Content of {document_id} ({content_format}) is incomplete, not caching it")
+            return content
+        with _content_cache_lock:
+            # Content larger than the whole cache is not cached
+            if len(content) <= _content_cache.maxsize:
+                _content_cache[cache_key] = content
+        return content
+    
+    def read_google_doc(self, document_id: str, mime_type: str = 'text/markdown', detailed: bool = False) -> str:
+        """
+        Read content from a Google Doc, exported as markdown (or another text format) by Google Drive.
+        
+        Documents too large for the Drive export are read through the Docs API instead.
+        Content is cached until the document is modified.
+        
+        Args:
+            document_id: The Google Drive document ID
+            mime_type: Export MIME type, like 'text/markdown' or 'text/plain'
+            detailed: Read the document structure (paragraphs and nested tables) through
+                      the Docs API instead of exporting it; mime_type is ignored then
+        """
+        if detailed:
+            return self._read_cached(document_id, 'structure', lambda: (self._read_google_doc_structure(document_id), True))
+        return self._read_cached(document_id, mime_type, lambda: (self._read_google_doc_content(document_id, mime_type), True))
+    
+    def _read_google_doc_content(self, document_id: str, mime_type: str) -> str:
+        """Read content from a Google Doc, without the content cache."""
         logger.info(f"Reading Google Doc: {document_id}")
         try:
-            doc = self.docs_service.documents().get(documentId=document_id).execute()
+            result = self._export_document(document_id, mime_type)
+        except HttpError as e:
+            if not _is_export_size_limit_error(e):
+                logger.error(f"Error reading Google Doc {document_id}: {e}", exc_info=True)
+                raise Exception(f"Error reading Google Doc: {e}") from e
+            logger.info(f"Google Doc {document_id} is too large to export, reading it through the Docs API")
+            return self._read_google_doc_structure(document_id)
+        
+        content_length = len(result) if result.strip() else 0
+        logger.info(f"Successfully read Google Doc ({content_length} characters)")
+        return result if result.strip() else "Document is empty."
+    
+    def _read_google_doc_structure(self, document_id: str) -> str:
+        """Read content from a Google Doc through the Docs API and convert to markdown-like text."""
+        try:
+            doc = self.docs_service.documents().get(
+                documentId=document_id,
+                fields=DOC_FIELDS
+            ).execute()
             logger.debug(f"Retrieved document: {doc.get('title', 'Untitled')}")
             
-            content_parts = []
-            
-            def extract_text(element):
-                """Recursively extract text from document elements."""
-                text = ""
-                if 'paragraph' in element:
-                    para = element['paragraph']
-                    if 'elements' in para:
-                        for elem in para['elements']:
-                            if 'textRun' in elem:
-                                text += elem['textRun'].get('content', '')
-                elif 'table' in element:
-                    # Handle tables
-                    table = element['table']
-                    if 'tableRows' in table:
-                        for row in table['tableRows']:
-                            row_text = []
-                            if 'tableCells' in row:
-                                for cell in row['tableCells']:
-                                    cell_text = ""
-                                    if 'content' in cell:
-                                        for content_elem in cell['content']:
-                                            cell_text += extract_text(content_elem)
-                                    row_text.append(cell_text)
-                            content_parts.append("| " + " | ".join(row_text) + " |")
-                            text += "\n"
-                return text
+            buf = io.StringIO()
+            write = buf.write
+            
+            def paragraph_text(para):
+                """Extract the text runs of a paragraph."""
+                return ''.join(
+                    elem['textRun'].get('content', '')
+                    for elem in para.get('elements', ())
+                    if 'textRun' in elem
+                )
+            
+            def write_table(table):
+                """
+                Write the rows of a table, including nested tables, as markdown table rows.
+                
+                Uses an explicit stack instead of recursion: a finished row line is pushed below
+                the tables nested in its cells, so nested rows are written before their outer row.
+                """
+                stack = [table]
+                while stack:
+                    item = stack.pop()
+                    if isinstance(item, str):
+                        write(item)
+                        continue
+                    
+                    for row in reversed(item.get('tableRows', [])):
+                        row_text = []
+                        nested_tables = []
+                        for cell in row.get('tableCells', []):
+                            cell_text = ""
+                            for content_elem in cell.get('content', []):
+                                if 'paragraph' in content_elem:
+                                    cell_text += paragraph_text(content_elem['paragraph'])
+                                elif 'table' in content_elem:
+                                    # A nested table only leaves one line break per row in the cell
+                                    nested_table = content_elem['table']
+                                    cell_text += "\n" * len(nested_table.get('tableRows', []))
+                                    nested_tables.append(nested_table)
+                            row_text.append(cell_text)
+                        stack.append("| " + " | ".join(row_text) + " |\n")
+                        stack.extend(reversed(nested_tables))
             
             if 'body' in doc and 'content' in doc['body']:
                 for element in doc['body']['content']:
-                    text = extract_text(element)
-                    if text.strip():
-                        content_parts.append(text)
+                    if 'paragraph' in element:
+                        text = paragraph_text(element['paragraph'])
+                        if text.strip():
+                            write(text)
+                            write("\n")
+                    elif 'table' in element:
+                        write_table(element['table'])
             
-            result = "\n".join(content_parts)
+            result = buf.getvalue()
             content_length = len(result) if result.strip() else 0
             logger.info(f"Successfully read Google Doc ({content_length} characters)")
             return result if result.strip() else "Document is empty."
             
         except HttpError as e:
             logger.error(f"Error reading Google Doc {document_id}: {e}", exc_info=True)
-            raise Exception(f"Error reading Google Doc: {e}")
+            raise Exception(f"Error reading Google Doc: {e}") from e
     
     def read_google_sheet(self, document_id: str) -> str:
-        """Read content from a Google Sheet and convert to text/CSV format."""
+        """Read content from a Google Sheet and convert to text/CSV format, cached until the sheet is modified."""
+        return self._read_cached(document_id, 'sheet', lambda: self._read_google_sheet_content(document_id))
+    
+    def _read_google_sheet_content(self, document_id: str) -> Tuple[str, bool]:
+        """
+        Read content from a Google Sheet, without the content cache.
+        
+        Returns:
+            Sheet content, and whether the values of all grid sheets could be read
+        """
         logger.info(f"Reading Google Sheet: {document_id}")
         try:
-            sheet = self.sheets_service.spreadsheets().get(spreadsheetId=document_id).execute()
+            sheet = self.sheets_service.spreadsheets().get(
+                spreadsheetId=document_id,
+                fields=SPREADSHEET_FIELDS
+            ).execute()
             logger.debug(f"Retrieved spreadsheet: {sheet.get('properties', {}).get('title', 'Untitled')}")
             
-            result_parts = []
-            result_parts.append(f"Spreadsheet: {sheet.get('properties', {}).get('title', 'Untitled')}\n")
+            buf = io.StringIO()
+            write = buf.write
+            write(f"Spreadsheet: {sheet.get('properties', {}).get('title', 'Untitled')}\n\n")
             
-            # Get all sheets
-            sheets = sheet.get('sheets', [])
+            # Get all sheets; only grid sheets have cell values, other sheets (like
+            # chart sheets) can't be read as ranges
+            sheets = [sheet_info['properties'] for sheet_info in sheet.get('sheets', [])]
+            grid_titles = [properties['title'] for properties in sheets if properties.get('sheetType', 'GRID') == 'GRID']
+            sheet_values = self._read_sheet_values(document_id, grid_titles)
             
-            for sheet_info in sheets:
-                sheet_title = sheet_info['properties']['title']
-                result_parts.append(f"\n## Sheet: {sheet_title}\n")
+            for properties in sheets:
+                sheet_title = properties['title']
+                write(f"\n## Sheet: {sheet_title}\n\n")
                 
-                # Get values from the sheet
-                range_name = f"{sheet_title}!A1:Z1000"  # Adjust range as needed
-                try:
-                    result = self.sheets_service.spreadsheets().values().get(
-                        spreadsheetId=document_id,
-                        range=range_name
-                    ).execute()
-                    
-                    values = result.get('values', [])
-                    if values:
-                        # Format as table
-                        for row in values:
-                            # Pad row to match max columns
-                            max_cols = max(len(r) for r in values) if values else 0
-                            row_padded = row + [''] * (max_cols - len(row))
-                            result_parts.append("| " + " | ".join(str(cell) for cell in row_padded) + " |")
-                    else:
-                        result_parts.append("(Empty sheet)")
-                except HttpError:
-                    result_parts.append("(Unable to read sheet data)")
-            
-            result = "\n".join(result_parts)
+                if properties.get('sheetType', 'GRID') != 'GRID':
+                    write("(Not a grid sheet, no cell data)\n")
+                    continue
+                
+                values = sheet_values.get(sheet_title)
+                if values is None:
+                    write("(Unable to read sheet data)\n")
+                    continue
+                
+                if values:
+                    # Format as table, padding rows to match max columns
+                    max_cols = max((len(r) for r in values), default=0)
+                    empty_pad = [''] * max_cols
+                    for row in values:
+                        row_padded = (row + empty_pad)[:max_cols]
+                        write("| " + " | ".join(str(cell) for cell in row_padded) + " |\n")
+                else:
+                    write("(Empty sheet)\n")
+            
+            result = buf.getvalue()
             logger.info(f"Successfully read Google Sheet ({len(result)} characters)")
-            return result
+            return result, len(sheet_values) == len(grid_titles)
             
         except HttpError as e:
             logger.error(f"Error reading Google Sheet {document_id}: {e}", exc_info=True)
-            raise Exception(f"Error reading Google Sheet: {e}")
+            raise Exception(f"Error reading Google Sheet: {e}") from e
+    
+    def _read_sheet_values(self, document_id: str, sheet_titles: List[str]) -> Dict[str, List[List[Any]]]:
+        """
+        Read the cell values of grid sheets, with a single request if possible.
+        
+        Args:
+            document_id: The Google Sheets document ID
+            sheet_titles: Titles of the grid sheets to read
+        
+        Returns:
+            Rows of cell values by sheet title; sheets that couldn't be read are missing
+        """
+        # Titles are quoted: titles containing '!', quotes or spaces, or looking like
+        # a cell reference, are otherwise not valid A1 sheet names
+        ranges = [
+            "'{}'!A1:Z1000".format(sheet_title.replace("'", "''"))  # Adjust range as needed
+            for sheet_title in sheet_titles
+        ]
+        if not ranges:
+            return {}
+        
+        try:
+            result = self.sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=document_id,
+                ranges=ranges,
+                fields="valueRanges(values)"
+            ).execute()
+            # Value ranges are returned in the order of the requested ranges
+            return {
+                sheet_title: value_range.get('values', [])
+                for sheet_title, value_range in zip(sheet_titles, result.get('valueRanges', []))
+            }
+        except HttpError as e:
+            logger.warning(f"Failed to read sheet values of {document_id} at once: {e}, reading sheets one by one")
+        
+        # One unreadable range fails the whole batch, so read the sheets separately
+        # and only report the ones that fail
+        sheet_values = {}
+        for sheet_title, sheet_range in zip(sheet_titles, ranges):
+            try:
+                result = self.sheets_service.spreadsheets().values().get(
+                    spreadsheetId=document_id,
+                    range=sheet_range,
+                    fields="values"
+                ).execute()
+                sheet_values[sheet_title] = result.get('values', [])
+            except HttpError as e:
+                logger.warning(f"Failed to read sheet '{sheet_title}' of {document_id}: {e}")
+        return sheet_values
     
     def read_google_slides(self, document_id: str) -> str:
-        """Read content from Google Slides and convert to text format."""
+        """
+        Read content from Google Slides, exported as plain text by Google Drive.
+        
+        Presentations too large for the Drive export are read through the Slides API instead.
+        Content is cached until the presentation is modified.
+        """
+        return self._read_cached(document_id, 'text/plain', lambda: (self._read_google_slides_content(document_id), True))
+    
+    def _read_google_slides_content(self, document_id: str) -> str:
+        """Read content from Google Slides, without the content cache."""
         logger.info(f"Reading Google Slides: {document_id}")
+        try:
+            result = self._export_document(document_id, 'text/plain')
+        except HttpError as e:
+            if not _is_export_size_limit_error(e):
+                logger.error(f"Error reading Google Slides {document_id}: {e}", exc_info=True)
+                raise Exception(f"Error reading Google Slides: {e}") from e
+            logger.info(f"Google Slides {document_id} is too large to export, reading it through the Slides API")
+            return self._read_google_slides_structure(document_id)
+        
+        logger.info(f"Successfully read Google Slides ({len(result)} characters)")
+        return result
+    
+    def _read_google_slides_structure(self, document_id: str) -> str:
+        """Read content from Google Slides through the Slides API and convert to text format."""
         try:
             presentation = self.slides_service.presentations().get(
-                presentationId=document_id
+                presentationId=document_id,
+                fields=PRESENTATION_FIELDS
             ).execute()
             logger.debug(f"Retrieved presentation: {presentation.get('title', 'Untitled')}")
             
-            result_parts = []
-            result_parts.append(f"Presentation: {presentation.get('title', 'Untitled')}\n")
+            buf = io.StringIO()
+            write = buf.write
+            write(f"Presentation: {presentation.get('title', 'Untitled')}\n\n")
             
             slides = presentation.get('slides', [])
             
             for i, slide in enumerate(slides, 1):
-                result_parts.append(f"\n## Slide {i}\n")
+                write(f"\n## Slide {i}\n\n")
                 
                 # Extract text from slide elements
                 if 'pageElements' in slide:
@@ -629,40 +1318,48 @@ class GoogleDriveClient:
                                     if 'textRun' in text_elem:
                                         text = text_elem['textRun'].get('content', '')
                                         if text.strip():
-                                            result_parts.append(text)
+                                            write(text)
+                                            write("\n")
                 
-                result_parts.append("")  # Empty line between slides
+                write("\n")  # Empty line between slides
             
-            result = "\n".join(result_parts)
+            result = buf.getvalue()
             logger.info(f"Successfully read Google Slides ({len(result)} characters)")
             return result
             
         except HttpError as e:
             logger.error(f"Error reading Google Slides {document_id}: {e}", exc_info=True)
-            raise Exception(f"Error reading Google Slides: {e}")
+            raise Exception(f"Error reading Google Slides: {e}") from e
     
-    def export_google_document(self, document_id: str, file_type: str = "markdown") -> str:
+    def export_google_document(self, document_id: str, file_type: str = "markdown", mime_type: Optional[str] = None) -> str:
         """
         Export a Google document to the specified format.
         
         Args:
             document_id: The Google Drive document ID
             file_type: Export format (markdown, text, csv, etc.)
+            mime_type: Google Drive MIME type of the document, if already known (e.g. from
+                       the file extension); otherwise it is looked up in Google Drive
         """
-        # Determine document type by trying to access it
-        try:
-            # Try as Google Doc
-            doc = self.docs_service.documents().get(documentId=document_id).execute()
-            content = self.read_google_doc(document_id)
-            if file_type.lower() == "markdown":
-                return content  # Already in markdown-like format
-            return content
-        except HttpError:
-            pass
+        if not mime_type:
+            # Determine document type from its Drive metadata
+            try:
+                file_info = self.drive_service.files().get(
+                    fileId=document_id,
+                    fields="mimeType"
+                ).execute()
+            except HttpError as e:
+                logger.error(f"Error getting document type of {document_id}: {e}", exc_info=True)
+                raise Exception(f"Error getting document type: {e}") from e
+            
+            mime_type = file_info.get('mimeType', '')
+            logger.debug("Document %s has MIME type %s", document_id, mime_type)
         
-        try:
-            # Try as Google Sheet
-            sheet = self.sheets_service.spreadsheets().get(spreadsheetId=document_id).execute()
+        if mime_type == DOCUMENT_MIME_TYPE:
+            export_mime_type = DOC_EXPORT_MIME_TYPES.get(file_type.lower(), 'text/markdown')
+            return self.read_google_doc(document_id, export_mime_type)
+        
+        elif mime_type == SPREADSHEET_MIME_TYPE:
             content = self.read_google_sheet(document_id)
             if file_type.lower() == "csv":
                 # Convert to CSV format
@@ -675,100 +1372,256 @@ class GoogleDriveClient:
                         csv_lines.append(','.join(f'"{cell}"' for cell in cells))
                 return '\n'.join(csv_lines)
             return content
-        except HttpError:
-            pass
         
-        try:
-            # Try as Google Slides
-            content = self.read_google_slides(document_id)
-            return content
-        except HttpError:
-            pass
+        elif mime_type == PRESENTATION_MIME_TYPE:
+            return self.read_google_slides(document_id)
         
-        raise Exception(f"Unable to determine document type for ID: {document_id}")
+        raise Exception(f"Unable to determine document type for ID: {document_id} (MIME type: {mime_type})")
+
+
+# Google Drive for desktop stores Google documents on the virtual drive as small JSON
+# stubs carrying the document ID, so reading the stub avoids resolving the path in Drive
+STUB_READ_LIMIT = 4096
+
+# Document IDs read from stub files (path -> (st_mtime_ns, document_id))
+_stub_id_cache: LRUCache = LRUCache(maxsize=1024)
+_stub_id_cache_lock = threading.Lock()
 
 
-# Global client instance (initialized on first use)
+def _read_stub_document_id(document_path: str) -> Optional[str]:
+    """
+    Read the document ID from the Google Drive for desktop stub file at document_path.
+    
+    IDs are cached per path until the stub file is modified.
+    
+    Args:
+        document_path: Filesystem path like "G:\\My Drive\\Projects\\Document.gdoc"
+    
+    Returns:
+        Document ID if the stub file exists and contains one, None otherwise
+    """
+    try:
+        mtime_ns = os.stat(document_path).st_mtime_ns
+    except OSError:
+        # Not accessible from here, e.g. the server runs on another machine than the virtual drive
+        return None
+    
+    with _stub_id_cache_lock:
+        cached_stub = _stub_id_cache.get(document_path)
+    if cached_stub is not None and cached_stub[0] == mtime_ns:
+        return cached_stub[1]
+    
+    try:
+        with open(document_path, 'rb') as f:
+            stub = json.loads(f.read(STUB_READ_LIMIT))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read document stub {document_path}: {e}")
+        return None
+    
+    document_id = stub.get('doc_id') if isinstance(stub, dict) else None
+    if not document_id or not isinstance(document_id, str):
+        logger.debug(f"Document stub {document_path} has no document ID")
+        return None
+    
+    with _stub_id_cache_lock:
+        _stub_id_cache[document_path] = (mtime_ns, document_id)
+    return document_id
+
+
+# Global client instance (initialized at startup or on first use)
 _drive_client: Optional[GoogleDriveClient] = None
+# Guards creating the client, which the startup warm-up and a first tool call may race on
+_drive_client_lock = threading.Lock()
+
+# Background task keeping the client's access token fresh
+_token_refresh_task: Optional[asyncio.Task] = None
 
 
 def get_drive_client() -> GoogleDriveClient:
     """Get or create the Google Drive client instance."""
     global _drive_client
     if _drive_client is None:
-        _drive_client = GoogleDriveClient()
+        with _drive_client_lock:
+            if _drive_client is None:
+                _drive_client = GoogleDriveClient()
+    _start_token_refresh()
     return _drive_client
 
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
+def _start_token_refresh() -> None:
+    """Start refreshing the client's access token in the background, once a client and event loop exist."""
+    global _token_refresh_task
+    if _drive_client is None or _token_refresh_task is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop running in this thread, the token is refreshed on demand
+        # until the client is next used from the event loop
+        return
+    _token_refresh_task = loop.create_task(_drive_client.token_refresh_loop())
+
+
+async def _warm_up_drive_client() -> None:
     """
-    List available tools that the server can execute.
+    Create the Google Drive client and open its connection ahead of the first tool call.
+    
+    Failures are not fatal here, tool calls retry creating the client and report the error.
     """
-    return [
-        Tool(
-            name="read_google_doc",
-            description="Read content from a Google Doc (.gdoc) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Document.gdoc').",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_name_in_filesystem": {
-                        "type": "string",
-                        "description": "REQUIRED: The FULL filesystem path to the .gdoc file, including drive letter and all folder names. Example: 'G:\\My Drive\\Projects\\Aideia\\Document.gdoc' or 'u:\\My Drive\\Folder\\Subfolder\\MyDocument.gdoc'. Do NOT provide just the filename - the complete path is required.",
-                    }
-                },
-                "required": ["document_name_in_filesystem"],
-            },
+    try:
+        client = await asyncio.to_thread(get_drive_client)
+        await asyncio.to_thread(client.warm_up)
+    except Exception as e:
+        logger.warning(f"Could not connect to Google Drive at startup: {e}")
+    _start_token_refresh()
+
+
+class ToolHandler(NamedTuple):
+    """How call_tool runs a tool on the document it was given."""
+    # Required document file extension, None accepts any Google document
+    extension: Optional[str]
+    # Reads the document: (client, document_id, file extension, arguments) -> content
+    read: Callable[[GoogleDriveClient, str, str, Dict[str, Any]], str]
+    # Header preceding the content, may refer to the requested {format}
+    header: str
+
+
+def _export_for_tool(client: GoogleDriveClient, document_id: str, extension: str, arguments: Dict[str, Any]) -> str:
+    """Export a document in the format requested in the tool arguments."""
+    export_format = arguments.get("format", "markdown")
+    logger.info("Exporting document to %s format", export_format)
+    # The file extension already tells the document type, so no type lookup is needed
+    mime_type = _EXT_TO_MIME.get(extension)
+    return client.export_google_document(document_id, export_format, mime_type)
+
+
+# Reads in progress ((tool name, document_id, format, detailed) -> task), so concurrent
+# identical tool calls share one read instead of each repeating the same Drive requests
+_inflight_reads: Dict[Tuple[str, str, str, bool], asyncio.Task] = {}
+
+
+async def _read_coalesced(key: Tuple[str, str, str, bool], read: Callable[..., str], *args: Any) -> str:
+    """
+    Run read(*args) in a worker thread, or join the identical read already in progress.
+    
+    Args:
+        key: (tool name, document_id, format, detailed) identifying the read
+        read: Blocking function reading the document
+        *args: Arguments passed to read
+    
+    Returns:
+        Result of read
+    """
+    task = _inflight_reads.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(read, *args))
+        _inflight_reads[key] = task
+        task.add_done_callback(lambda _: _inflight_reads.pop(key, None))
+    else:
+        logger.info("Joining read in progress for %s", key)
+    # Shielded, so a cancelled caller doesn't cancel the read for the others
+    return await asyncio.shield(task)
+
+
+# Tool name -> handler, see call_tool
+TOOL_HANDLERS: Dict[str, ToolHandler] = {
+    "read_google_doc": ToolHandler(
+        '.gdoc',
+        lambda client, document_id, extension, arguments: client.read_google_doc(
+            document_id, detailed=bool(arguments.get("detailed", False))
         ),
-        Tool(
-            name="read_google_sheets",
-            description="Read content from a Google Sheet (.gsheet) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Spreadsheet.gsheet').",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_name_in_filesystem": {
-                        "type": "string",
-                        "description": "REQUIRED: The FULL filesystem path to the .gsheet file, including drive letter and all folder names. Example: 'G:\\My Drive\\Projects\\Aideia\\Spreadsheet.gsheet' or 'u:\\My Drive\\Folder\\Subfolder\\MySheet.gsheet'. Do NOT provide just the filename - the complete path is required.",
-                    }
-                },
-                "required": ["document_name_in_filesystem"],
+        "Google Doc Content"
+    ),
+    "read_google_sheets": ToolHandler(
+        '.gsheet',
+        lambda client, document_id, extension, arguments: client.read_google_sheet(document_id),
+        "Google Sheet Content"
+    ),
+    "read_google_slides": ToolHandler(
+        '.gslides',
+        lambda client, document_id, extension, arguments: client.read_google_slides(document_id),
+        "Google Slides Content"
+    ),
+    "export_google_document": ToolHandler(None, _export_for_tool, "Exported Document ({format})"),
+}
+
+
+def _document_input_schema(file_kind: str, example_name: str, other_example_name: str, **properties: Any) -> Dict[str, Any]:
+    """
+    Build the input schema of a tool taking the filesystem path of a Google document.
+    
+    Args:
+        file_kind: File described in the path argument, like ".gdoc"
+        example_name: File name in the first example path
+        other_example_name: File name in the second example path
+        **properties: Schemas of further, optional arguments
+    
+    Returns:
+        JSON schema of the tool input
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "document_name_in_filesystem": {
+                "type": "string",
+                "description": (
+                    f"REQUIRED: The FULL filesystem path to the {file_kind} file, including drive letter and all folder names. "
+                    f"Example: 'G:\\My Drive\\Projects\\Aideia\\{example_name}' or 'u:\\My Drive\\Folder\\Subfolder\\{other_example_name}'. "
+                    "Do NOT provide just the filename - the complete path is required."
+                ),
             },
-        ),
-        Tool(
-            name="read_google_slides",
-            description="Read content from a Google Slides (.gslides) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Presentation.gslides').",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_name_in_filesystem": {
-                        "type": "string",
-                        "description": "REQUIRED: The FULL filesystem path to the .gslides file, including drive letter and all folder names. Example: 'G:\\My Drive\\Projects\\Aideia\\Presentation.gslides' or 'u:\\My Drive\\Folder\\Subfolder\\MySlides.gslides'. Do NOT provide just the filename - the complete path is required.",
-                    }
-                },
-                "required": ["document_name_in_filesystem"],
+            **properties,
+        },
+        "required": ["document_name_in_filesystem"],
+    }
+
+
+# Tools offered by the server, built once and shared by all list_tools requests
+_TOOLS: List[Tool] = [
+    Tool(
+        name="read_google_doc",
+        description="Read content from a Google Doc (.gdoc) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Document.gdoc').",
+        inputSchema=_document_input_schema(
+            ".gdoc", "Document.gdoc", "MyDocument.gdoc",
+            detailed={
+                "type": "boolean",
+                "description": "Read the document structure (paragraphs and nested tables) through the Google Docs API instead of the markdown export by Google Drive. Default: false",
+                "default": False,
             },
         ),
-        Tool(
-            name="export_google_document",
-            description="Export a Google Drive document (.gdoc, .gsheet, or .gslides) to markdown or other formats. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_name_in_filesystem": {
-                        "type": "string",
-                        "description": "REQUIRED: The FULL filesystem path to the Google Drive document file, including drive letter and all folder names. Example: 'G:\\My Drive\\Projects\\Aideia\\Document.gdoc' or 'u:\\My Drive\\Folder\\Subfolder\\MyDocument.gdoc'. Do NOT provide just the filename - the complete path is required.",
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Export format: 'markdown', 'text', 'csv' (for sheets). Default: 'markdown'",
-                        "enum": ["markdown", "text", "csv"],
-                        "default": "markdown",
-                    },
-                },
-                "required": ["document_name_in_filesystem"],
+    ),
+    Tool(
+        name="read_google_sheets",
+        description="Read content from a Google Sheet (.gsheet) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Spreadsheet.gsheet').",
+        inputSchema=_document_input_schema(".gsheet", "Spreadsheet.gsheet", "MySheet.gsheet"),
+    ),
+    Tool(
+        name="read_google_slides",
+        description="Read content from a Google Slides (.gslides) file accessible via the Windows virtual drive. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename (e.g., 'G:\\My Drive\\Projects\\Presentation.gslides').",
+        inputSchema=_document_input_schema(".gslides", "Presentation.gslides", "MySlides.gslides"),
+    ),
+    Tool(
+        name="export_google_document",
+        description="Export a Google Drive document (.gdoc, .gsheet, or .gslides) to markdown or other formats. REQUIRES THE FULL FILESYSTEM PATH, not just the filename. The path must include the drive letter, folder structure, and filename.",
+        inputSchema=_document_input_schema(
+            "Google Drive document", "Document.gdoc", "MyDocument.gdoc",
+            format={
+                "type": "string",
+                "description": "Export format: 'markdown', 'text', 'csv' (for sheets). Default: 'markdown'",
+                "enum": ["markdown", "text", "csv"],
+                "default": "markdown",
             },
         ),
-    ]
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """
+    List available tools that the server can execute.
+    """
+    return _TOOLS
 
 
 @app.call_tool()
@@ -776,90 +1629,69 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """
     Execute a tool by name with the provided arguments.
     """
-    logger.info(f"Tool called: {name} with arguments: {arguments}")
+    # Lazy formatting, the arguments are only formatted if the record is emitted
+    logger.info("Tool called: %s with arguments: %s", name, arguments)
     try:
-        client = get_drive_client()
+        handler = TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        
+        # Creating the client may wait for the startup warm-up or run the OAuth flow,
+        # so it runs in a worker thread; the token refresh task needs the event loop
+        client = await asyncio.to_thread(get_drive_client)
+        _start_token_refresh()
         document_path = arguments.get("document_name_in_filesystem", "")
         
         if not document_path:
-            error_msg = "document_name_in_filesystem is required"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+            raise ValueError("document_name_in_filesystem is required")
         
-        logger.info(f"Processing document: {document_path}")
-        # Find document in Google Drive by name and path
-        document_id = client.find_document_by_path(document_path)
+        extension = os.path.splitext(document_path)[1].lower()
+        if handler.extension and extension != handler.extension:
+            raise ValueError(f"File must be a {handler.extension} file")
+        
+        logger.info("Processing document: %s", document_path)
+        # Prefer the document ID from the local stub file; otherwise find the document in
+        # Google Drive by name and path. Both run in worker threads so the event loop keeps
+        # serving other requests while the virtual drive or Drive API responds.
+        document_id = await asyncio.to_thread(_read_stub_document_id, document_path)
+        if document_id:
+            logger.info("Read document ID from stub file: %s", document_id)
+        else:
+            document_id = await asyncio.to_thread(client.find_document_by_path, document_path)
         
         if not document_id:
-            error_msg = (
+            raise ValueError(
                 f"Could not find document in Google Drive: {document_path}. "
                 "Make sure the document exists in your Google Drive and you have access to it."
             )
-            logger.error(error_msg)
-            raise ValueError(error_msg)
         
-        logger.info(f"Extracted document ID: {document_id}")
+        logger.info("Extracted document ID: %s", document_id)
         
-        if name == "read_google_doc":
-            if not document_path.lower().endswith('.gdoc'):
-                error_msg = "File must be a .gdoc file"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            content = client.read_google_doc(document_id)
-            logger.info(f"Successfully read Google Doc, returning {len(content)} characters")
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Google Doc Content:\n\n{content}",
-                )
-            ]
-        
-        elif name == "read_google_sheets":
-            if not document_path.lower().endswith('.gsheet'):
-                error_msg = "File must be a .gsheet file"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            content = client.read_google_sheet(document_id)
-            logger.info(f"Successfully read Google Sheet, returning {len(content)} characters")
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Google Sheet Content:\n\n{content}",
-                )
-            ]
-        
-        elif name == "read_google_slides":
-            if not document_path.lower().endswith('.gslides'):
-                error_msg = "File must be a .gslides file"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            content = client.read_google_slides(document_id)
-            logger.info(f"Successfully read Google Slides, returning {len(content)} characters")
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Google Slides Content:\n\n{content}",
-                )
-            ]
-        
-        elif name == "export_google_document":
-            export_format = arguments.get("format", "markdown")
-            logger.info(f"Exporting document to {export_format} format")
-            content = client.export_google_document(document_id, export_format)
-            logger.info(f"Successfully exported document, returning {len(content)} characters")
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Exported Document ({export_format}):\n\n{content}",
-                )
-            ]
-        
-        else:
-            error_msg = f"Unknown tool: {name}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        # The readers block on Drive requests too, so they also run in worker threads
+        read_key = (name, document_id, arguments.get("format", "markdown"), bool(arguments.get("detailed", False)))
+        content = await _read_coalesced(read_key, handler.read, client, document_id, extension, arguments)
+        logger.info("Successfully ran %s, returning %d characters", name, len(content))
+        header = handler.header.format(format=arguments.get("format", "markdown"))
+        # Header and content go in separate entries, so large content isn't copied into a new string
+        return [
+            TextContent(
+                type="text",
+                text=f"{header}:",
+            ),
+            TextContent(
+                type="text",
+                text=content,
+            ),
+        ]
     
     except Exception as e:
+        # A cached document ID goes stale when the document is moved or deleted,
+        # so resolve the path again on the next call
+        cause = e.__cause__
+        if isinstance(cause, HttpError) and cause.resp.status == 404 and _drive_client is not None:
+            _drive_client.forget_document_path(arguments.get("document_name_in_filesystem", ""))
+        
+        # Errors are logged here only, with the traceback
         error_msg = f"Error executing tool '{name}': {str(e)}"
         logger.error(error_msg, exc_info=True)
         return [
@@ -879,6 +1711,10 @@ async def main():
     # Run the server using stdio transport
     try:
         async with stdio_server() as (read_stream, write_stream):
+            # Authenticate and connect in the background while the MCP handshake is answered,
+            # so neither the handshake nor the first tool call waits for it; the task is
+            # kept referenced here until the server stops
+            warm_up_task = asyncio.create_task(_warm_up_drive_client())
             logger.info("MCP server initialized, waiting for requests...")
             await app.run(
                 read_stream,